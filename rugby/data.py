@@ -1,5 +1,3 @@
-import ast
-
 import pandas as pd
 import numpy as np
 
@@ -3,13 +3,11 @@ Match information.
 """
 
 import ast
-import json, yaml
+import json
 
 import pandas as pd
 import numpy as np
 
-from flask import url_for
-
 from .player import Player
 from .scores import Scores
 from .utils import json_serial, total_time_from_ranges
@@ -19,7 +17,7 @@ class Match(object):
 
     def __init__(self, row, tournament=None):
         """
-        A row from the JSON data file.
+        A row from the JSON data file, either as a dict or as a pandas Series.
         """
 
 
@@ -48,7 +46,7 @@ class Match(object):
 
         if "stadium" in row:
             self.stadium = row["stadium"]
-        if hasattr(row, "tround"):
+        if "tround" in row:
             self.round = row['tround']
 
         # Store tournament metadata
@@ -84,10 +82,7 @@ class Match(object):
                 
         else:
             self.scores = None
-        try:
-            self.url = row.url
-        except:
-            self.url = None
+        self.url = row.get("url")
 
     def find_player(self, search):
         if self.lineups:
@@ -101,7 +96,7 @@ class Match(object):
         """
         Get a list of all of the scoring events in this match.
         """
-        scores = self.scores['home'].scores.append(self.scores['away'].scores)
+        scores = pd.concat([self.scores['home'].scores, self.scores['away'].scores])
         return Scores(scores)
 
     def to_dict(self):
@@ -140,6 +135,8 @@ class Match(object):
 
     def to_yaml(self, filename=None):
         """Serialise this object in YAML format."""
+        import yaml
+
         if filename:
             with open(filename, "w") as f:
                 yaml.safe_dump(self.to_dict(), stream=f)
@@ -147,8 +144,11 @@ class Match(object):
             return yaml.safe_dump(self.to_dict())
 
     def to_rest(self):
+        from flask import url_for
+
         home = self.teams['home'].short_name
         away = self.teams['away'].short_name
+        date = self.date.date().isoformat()
 
         if pd.isna(self.score['home']):
                 score = None
@@ -159,10 +159,10 @@ class Match(object):
                     season=self.season,
                     tournament=self.tournament,
                     url=url_for("match", home=home, away=away,
-                                date=f"{self.date:%Y-%m-%d}",
+                                date=date,
                                 _external=False),
-                    lineups=url_for("lineup", home=home, away=away, date=f"{self.date:%Y-%m-%d}", _external=False),
-                    events=url_for("events", home=home, away=away, date=f"{self.date:%Y-%m-%d}", _external=False), 
+                    lineups=url_for("lineup", home=home, away=away, date=date, _external=False),
+                    events=url_for("events", home=home, away=away, date=date, _external=False), 
                     stadium=None,
                     
                     score = score,
@@ -178,7 +178,6 @@ class Match(object):
         """
         with open(file, "r") as f:
             data = json.load(f)
-        data = pd.DataFrame.from_dict([data]).iloc[0]
 
         return cls(data)
 
@@ -187,9 +186,10 @@ class Match(object):
         """
         Create a match from a yaml file.
         """
+        import yaml
+
         with open(file, "r") as f:
             data = yaml.safe_load(f)
-        data = pd.DataFrame.from_dict([data]).iloc[0]
         return cls(data)
 
     # @classmethod
@@ -262,13 +262,17 @@ class Lineup(object):
         self.lineup.index = np.array(self.lineup.index, dtype=int)
         self.lineup.sort_index(inplace=True)
         
-        self.lineup['game time'] = 0
+        game_times = []
         self.time_ranges = {}
         for key, value in self.lineup.iterrows():
             time_range, total_time = self._time_ranges(value)
             if pd.isna(total_time): total_time = 0
-            self.lineup.at[key, 'game time'] = total_time
+            game_times.append(total_time)
             self.time_ranges[value['name']] = time_range
+        game_times = pd.Series(game_times, index=self.lineup.index, dtype=float)
+        if (game_times % 1 == 0).all():
+            game_times = game_times.astype("int64")
+        self.lineup['game time'] = game_times
 
     @classmethod
     def _time_ranges(cls, value):
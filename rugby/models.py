@@ -318,7 +318,7 @@ class Match(Base):
 
     @classmethod
     def remove(cls, home, away, date, session=session):
-        date = datetime.strptime(date, "%Y-%m-%d")
+        date = datetime.fromisoformat(date)
         home = Team.from_query(home, session).id
         away = Team.from_query(away, session).id
         match = session.query(Match).filter(
@@ -329,14 +329,14 @@ class Match(Base):
         
     @classmethod
     def update(cls, home, away, date, data, session=session):
-        date = datetime.strptime(date, "%Y-%m-%d")
+        date = datetime.fromisoformat(date)
         home = Team.from_query(home, session).id
         away = Team.from_query(away, session).id
         match = session.query(Match).filter(
             Match.date.between(date, date+timedelta(days=1))).filter_by(home=home, away=away).one()
         
         if 'date' in data:
-            match.date = datetime.strptime(data['date'], "%Y-%m-%d")
+            match.date = datetime.fromisoformat(data['date'])
         if ('season' in data) and ('tournament' in data):
             season = Season.from_query(season=data['season'],
                                              tournament=data['tournament'],
@@ -362,7 +362,7 @@ class Match(Base):
         away = Team.from_query(away, session).id
 
         if date:
-            date = datetime.strptime(date, "%Y-%m-%d")
+            date = datetime.fromisoformat(date)
         
             match = session.query(Match).filter(Match.date.between(date, date+timedelta(days=1))).filter_by(home=home, away=away).one()
             match_o = rugby.data.Match(match.to_dict(session))
@@ -389,7 +389,7 @@ class Match(Base):
             match = session.query(Match).filter_by(date=match['date'], home=home.id, away=away.id, season=season.id).one()
         except NoResultFound:
 
-            date=datetime.strptime(match['date'], "%Y-%m-%d")
+            date=datetime.fromisoformat(match['date'])
             
             match = Match(date=date,
                  season=season.id,
@@ -461,10 +461,6 @@ class Player(Base):
         except NoResultFound:
             return None
 
-    @property
-    def name(self):
-        return f"{self.firstname} {self.surname}"
-        
     @property
     def to_dict(self):
         return {"name": f"{self.firstname} {self.surname}",
@@ -506,7 +502,7 @@ class Position(Base):
     def from_query(cls, home, away, date, session=session):
         home = Team.from_query(home.replace("_", " "), session).id
         away = Team.from_query(away.replace("_", " "), session).id
-        date = datetime.strptime(date, "%Y-%m-%d")
+        date = datetime.fromisoformat(date)
         
         match = session.query(Match).filter(Match.date.between(date, date+timedelta(days=1))).filter_by(home=home, away=away).one()
         positions = session.query(cls).filter_by(match=match.id).all()
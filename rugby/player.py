@@ -110,8 +110,9 @@ class Player():
         points against
         """
         results = {}
+        time_range = self.time_range(match)
         for state in ["home", "away"]:
-            on_field = match.scores[state].in_times(self.time_range(match))
+            on_field = match.scores[state].in_times(time_range)
             results[state] = on_field.sum()['value']
         if self.name in match.lineups['home'].time_ranges:
             return results['home'], results['away']
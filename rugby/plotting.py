@@ -2,7 +2,6 @@ import matplotlib.pyplot as plt
 import numpy as np
 import matplotlib
 import pandas as pd
-import datetime
 
 from cycler import cycler
 
@@ -28,7 +27,8 @@ style = {
     "grid.color": "#4298bd",
     "grid.alpha": 0.5,
     # Display
-    "figure.dpi": 300,
+    "figure.dpi": 100,
+    "savefig.dpi": 300,
     # Face colors
     "axes.facecolor": "#ecf5f8",
     "figure.facecolor": "#FFFFFFFF"
@@ -135,9 +135,12 @@ def annotate_heatmap(im, data=None, valfmt="{x:.2f}",
         data = im.get_array()
 
     cell_data = im.get_array()
+    # Colour thresholds
+    lower = 0.75 * cell_data.min()
+    upper = 0.75 * cell_data.max()
     def text_color(datum):
-        if datum  < 0.75 * cell_data.min(): return "white"
-        elif datum  > 0.75 * cell_data.max(): return "white"
+        if datum  < lower: return "white"
+        elif datum  > upper: return "white"
         else: return "black"
     # Normalize the threshold to the images color range.
     #if threshold is not None:
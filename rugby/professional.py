@@ -2,21 +2,21 @@ import requests
 import bs4
 from bs4 import BeautifulSoup
 import dateparser
-import yaml
 import pandas
 import json
 
+from concurrent.futures import ThreadPoolExecutor
+
 import rugby
 import rugby.data
+from rugby.utils import json_serial
 
-from datetime import date, datetime
-
-def json_serial(obj):
-    """JSON serializer for objects not serializable by default json code"""
+# Shared HTTP session
+session = requests.Session()
 
-    if isinstance(obj, (datetime, date)):
-        return obj.isoformat()
-    raise TypeError ("Type %s not serializable" % type(obj))
+# The icons used to mark lineup events, with the lineup field each one records a minute in.
+LINEUP_EVENTS = {"substitution_off.svg": "off", "substitution_on.svg": "on",
+                 "yellow_card.svg": "yellows", "red_card.svg": "reds"}
 
 def process_game_page(url, season = None, season_range=[8,7]):
     
@@ -26,20 +26,22 @@ def process_game_page(url, season = None, season_range=[8,7]):
     
     match = {}
     
-    r2 = requests.get(url)
+    r2 = session.get(url)
     soup = BeautifulSoup(r2.text, 'html.parser')
     body = soup.find("body")
     matchhead = body.find("div", {"class": "match-head"})
     
     details = matchhead.find_all("li")
-    date_temp = dateparser.parse(f"{details[1].text}")
+    # The pages are always in English, and telling dateparser so skips its
+    # (slow) language detection.
+    date_temp = dateparser.parse(details[1].text, languages=["en"])
     if date_temp.month < season_range[0]:
         # Must be in the second year of the season
         year=years[1]
     else:
         year=years[0]
     # Need to manually modify the date as there's no year in the string
-    match['date'] = dateparser.parse(f"{details[1].text} {year}")
+    match['date'] = date_temp.replace(year=year)
     
     match['stadium'] = details[2].text.split("\n")[0].strip()    
     match['home'] = {}
@@ -74,27 +76,20 @@ def process_game_page(url, season = None, season_range=[8,7]):
                     name = player.find("span", {"class": "team-lineups__list-player-name"}).text.strip()
 
 
-                    offs = []
-                    ons = []
-                    yellows = []
-                    reds = []
+                    entry = {"name":name, "on": [], "off": [], "reds": [], "yellows": []}
                     events = player.find_all("span", {"class": "team-lineups__list-events"})
                     for event in events:
                         img = event.find("img")
                         if img:
-                            if (img.get("src").split("/")[-1]) == "substitution_off.svg":
-                                offs.append(int(event.text.strip().split("'")[0]))
-                            elif (img.get("src").split("/")[-1]) == "substitution_on.svg":
-                                ons.append(int(event.text.strip().split("'")[0]))
-                            elif (img.get("src").split("/")[-1]) == "yellow_card.svg":
-                                yellows.append(int(event.text.strip().split("'")[0]))
-                            elif (img.get("src").split("/")[-1]) == "red_card.svg":
-                                reds.append(int(event.text.strip().split("'")[0]))
+                            icon = img.get("src").split("/")[-1]
+                            field = LINEUP_EVENTS.get(icon)
+                            if field:
+                                entry[field].append(int(event.text.strip().split("'")[0]))
                             else:
-                                print("Unknown event type: {}".format(img.get("src").split("/")[-1]))
+                                print("Unknown event type: {}".format(icon))
                     if number <= 15:
-                        ons.append(0)
-                    lineups[lineup][number] = {"name":name, "on": ons, "off": offs, "reds": reds, "yellows": yellows}
+                        entry["on"].append(0)
+                    lineups[lineup][number] = entry
                 except:
                     continue
         match['home']['lineup'] = lineups['home']
@@ -105,6 +100,10 @@ def process_game_page(url, season = None, season_range=[8,7]):
 
 
 
+# The headings used in the scorers list, with the score type and value they introduce.
+SCORING_TYPES = {"Tries:":"try", "Penalties:":"penalty", "Conversions:": "conversion", "Drop-Goals:": "drop goal"}
+SCORING_VALUES = {"Tries:":5, "Penalties:":3, "Conversions:": 2, "Drop-Goals:": 3}
+
 def process_team_details(teamdetails):
     
 
@@ -113,15 +112,13 @@ def process_team_details(teamdetails):
 
 
     scores = teamdetails.find("p", {"class":"match-head__scorers"})
-    types={"Tries:":"try", "Penalties:":"penalty", "Conversions:": "conversion", "Drop-Goals:": "drop goal"}
-    values={"Tries:":5, "Penalties:":3, "Conversions:": 2, "Drop-Goals:": 3}
     scoresdic = []
     current = ""
     for score in scores.children:
         if (isinstance(score, bs4.element.Tag)) : 
             if (score.text.strip())=="": continue
-            current = types[score.text]
-            value = values[score.text]
+            current = SCORING_TYPES[score.text]
+            value = SCORING_VALUES[score.text]
         elif not current == "":
             insert = score.strip().split(",")
             cplayer = ""
@@ -158,25 +155,38 @@ def get_match_list(league, season, base = "http://www.skysports.com/rugby-union/
     url = "{}/{}/results/{}".format(base, league.lower(), season)
     print(url)
     
-    r = requests.get(url)
+    r = session.get(url)
     soup = BeautifulSoup(r.text, 'html.parser')
 
     links = soup.find_all("a", {"class":"matches__item matches__link"})
     # matches__item matches__link
     urls = []
     for link in links:
-        year = link.find_previous("h3", {"class": "fixres__header1"}).text.strip().split()[1]
-        date = link.find_previous("h4", {"class": "fixres__header2"}).text.strip()
-        date = dateparser.parse(f"{year} {date}")
         url = link.get("href").split("/")
         url.insert(-1, "teams")
         url = "/".join(url)
         urls.append(url)
     return urls
 
+def download_games(urls, season, season_range=[8,7], workers=8):
+    """
+    Download the pages for a list of matches concurrently.
+
+    The match pages are independent of one another, so they are
+    fetched by a pool of threads rather than one after another.
+    The games are returned in the same order as the URLs.
+    """
+    def download(url):
+        game = process_game_page(url, season=season, season_range=season_range)
+        game['url'] = url
+        return game
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(download, urls))
+
 def download_json(season, league, 
                   base = "http://www.skysports.com/rugby-union/competitions", season_range=[8,7],
-                  use_recent=False,
+                  use_recent=False, workers=8,
                  ):
     urls = get_match_list(league=league, season=season, use_recent=use_recent)
     
@@ -184,23 +194,16 @@ def download_json(season, league,
         games = pandas.read_json(rugby.__path__[0]+"/json/{}-{}.json".format(league, season), dtype=object)
         
         matches = [rugby.data.Match(row) for index, row in games.iterrows()]
-        match_urls = [match.url for match in matches]
+        match_urls = set(match.url for match in matches)
 
     except:
-        match_urls = []
+        match_urls = set()
         games = pandas.DataFrame()
 
-    number = 0
-    for url in urls:
-        if url in match_urls: 
-            game = None
-        else:
-            number += 1
-            game = process_game_page(url, season=season, season_range=season_range)
-        
-            game['url'] = url
-        if game:
-            games = games.append(game, ignore_index=True)
+    new_urls = [url for url in urls if url not in match_urls]
+    number = len(new_urls)
+    new_games = pandas.DataFrame(download_games(new_urls, season=season, season_range=season_range, workers=workers))
+    games = pandas.concat([games, new_games], ignore_index=True)
     print(f"Downloaded {number} new results")
     with open(rugby.__path__[0]+"/json_data/{}-{}.json".format(league, season), 'w') as f:
         json.dump(games.to_dict(), f, default=json_serial)
@@ -217,16 +220,13 @@ def get_fixture_list(league, season, base = "http://www.skysports.com/rugby-unio
     season = "-".join([season[0], season[1][2:]])
     
     url = "{}/{}/fixtures".format(base, league.lower())
-    r = requests.get(url)
+    r = session.get(url)
     soup = BeautifulSoup(r.text, 'html.parser')
 
     links = soup.find_all("a", {"class":"matches__item matches__link"})
     # matches__item matches__link
     urls = []
     for link in links:
-        year = link.find_previous("h3", {"class": "fixres__header1"}).text.strip().split()[1]
-        date = link.find_previous("h4", {"class": "fixres__header2"}).text.strip()
-        date = dateparser.parse(f"{year} {date}")
         url = link.get("href").split("/")
         url.insert(-1, "teams")
         url = "/".join(url)
@@ -234,30 +234,23 @@ def get_fixture_list(league, season, base = "http://www.skysports.com/rugby-unio
     return urls
 
 def download_fixtures(season, league, 
-                  base = "http://www.skysports.com/rugby-union/competitions", season_range=[8,7]):
+                  base = "http://www.skysports.com/rugby-union/competitions", season_range=[8,7],
+                  workers=8):
     urls = get_fixture_list(league=league, season=season)
     
     try:
         games = pandas.read_json(rugby.__path__[0]+"/json-data/{}-fixtures.json".format(league), dtype=object)
     
         #matches = [rugby.data.Match(row) for index, row in data.iterrows()]
-        match_urls = [game.url for i, game in games.iterrows()]
+        match_urls = set(games['url'])
 
     except:
-        match_urls = []
+        match_urls = set()
         games = pandas.DataFrame()
-    number = 0
-    for url in urls:
-        if url in match_urls: 
-            game = None
-        else:
-        
-            game = process_game_page(url, season=season, season_range=season_range)
-        
-            game['url'] = url
-        if game:
-            number += 1
-            games = games.append(game, ignore_index=True)
+    new_urls = [url for url in urls if url not in match_urls]
+    number = len(new_urls)
+    new_games = pandas.DataFrame(download_games(new_urls, season=season, season_range=season_range, workers=workers))
+    games = pandas.concat([games, new_games], ignore_index=True)
     print(f"Downloaded {number} new fixtures")
     with open(rugby.__path__[0]+"/json_data/{}-fixtures.json".format(league), 'w') as f:
         json.dump(games.T.to_dict(), f, default=json_serial)
@@ -15,10 +15,13 @@ class Scores(object):
             self.total = 0
 
     def in_times(self, time_range):
-        on_field = []
-        for i, score in self.scores.iterrows():
-            for trange in time_range:
-                on_field.append(trange[0] <= score.minute <= trange[1])
+        """Find the scoring events which happened inside any of the time ranges."""
+        if 'minute' not in self.scores:
+            return self.scores
+        minutes = self.scores['minute'].values
+        on_field = np.zeros(len(minutes), dtype=bool)
+        for trange in time_range:
+            on_field |= (minutes >= trange[0]) & (minutes <= trange[1])
         return self.scores[on_field]
     
             
@@ -1,4 +1,3 @@
-import ast
 from itertools import chain
 
 import pandas as pd
@@ -6,7 +5,6 @@ import numpy as np
 
 import json
 
-from . import models
 from .match import Match, Lineup
 from .team import Team
 from . import utils
@@ -34,14 +32,18 @@ class Tournament():
             self.team_conferences = cons
             
         if isinstance(matches, pd.DataFrame):
-            self.matches = [Match(x, tournament=self) for i, x in matches.iterrows()]
+            matches = [Match(x, tournament=self) for i, x in matches.iterrows()]
         else:
-            self.matches = [Match(x, tournament=self) for x in matches]
-            
-        self.future = [match for match in self.matches if (match.score==None) or (pd.isna(match.score['home']))]
-        
-        for match in self.future:
-            self.matches.remove(match)
+            matches = [Match(x, tournament=self) for x in matches]
+
+        # Split played matches from future ones
+        self.matches = []
+        self.future = []
+        for match in matches:
+            if (match.score==None) or (pd.isna(match.score['home'])):
+                self.future.append(match)
+            else:
+                self.matches.append(match)
         
     @classmethod
     def from_json(cls, file):
@@ -55,7 +57,7 @@ class Tournament():
         with open(file, "r") as f:
             data =json.load(f)
 
-        matches = pd.DataFrame.from_dict(data['matches'])
+        matches = data['matches']
         if "teams" in data.keys():
             teams = data['teams']
         else:
@@ -77,6 +79,8 @@ class Tournament():
         """
         Save this tournament to the database.
         """
+        from . import models
+
         season = models.Season.add(self)
         
         for team in self.teams():
@@ -161,7 +165,7 @@ class Tournament():
         Return a set of all of the teams which had matches in this tournament.
         """
         if not hasattr(self, "team_list"):
-            teams =  list(set(chain.from_iterable((x.teams['home'], x.teams['away']) for x in self.matches+self.future)))
+            teams =  list(set(chain.from_iterable((x.teams['home'], x.teams['away']) for x in chain(self.matches, self.future))))
             if len(teams)>0:
                 if isinstance(teams[0], Team):
                     return teams
@@ -174,11 +178,10 @@ class Tournament():
         """
         Provide a list of all of the positions played.
         """
-        positions = pd.DataFrame([])
-        positions = positions.append([x.lineups['home'].lineup for x in self.matches], ignore_index=True)
-        positions = positions.append( [x.lineups['away'].lineup for x in self.matches], ignore_index=True)
-        #positions = chain(*positions)
-        return positions #list(positions)
+        positions = [x.lineups['home'].lineup for x in self.matches] + [x.lineups['away'].lineup for x in self.matches]
+        if len(positions) == 0:
+            return pd.DataFrame([])
+        return pd.concat(positions, ignore_index=True)
 
     def fixtures_table(self, future=False):
         if not future:
@@ -225,19 +228,19 @@ class Tournament():
         df["Home P"] += 1*((df['home tries']>=4))
         df["Home B"] += 1*((df['home tries']>=4))
 
-        points = []
-        for team in self.teams():
-            points.append({"team": team,
-                           "conference": self.team_conferences.get(team.short_name, "A"),
-                           "played": df[df.home==team.short_name].count()['Home P'] + df[df.away==team.short_name].count()['Away P'],
-                           "won": df[df.home==team.short_name].sum()['Home W'] + df[df.away==team.short_name].sum()['Away W'],
-                           "drawn": df[df.home==team.short_name].sum()['Home D'] + df[df.away==team.short_name].sum()['Away D'],
-                           "lost": df[df.home==team.short_name].sum()['Home L'] + df[df.away==team.short_name].sum()['Away L'],
-                           "for": df[df.home==team.short_name].sum()['home_score'] + df[df.away==team.short_name].sum()['away_score'],
-                           "against": df[df.home==team.short_name].sum()['away_score'] + df[df.away==team.short_name].sum()['home_score'],
-                           "bonus": df[df.home==team.short_name].sum()['Home B'] + df[df.away==team.short_name].sum()['Away B'],
-                           "points": df[df.home==team.short_name].sum()['Home P'] + df[df.away==team.short_name].sum()['Away P']})
-        league = pd.DataFrame(points)
+        # Totals
+        columns = ["team", "won", "drawn", "lost", "for", "against", "bonus", "points"]
+        home = df[["home", "Home W", "Home D", "Home L", "home_score", "away_score", "Home B", "Home P"]].set_axis(columns, axis=1)
+        away = df[["away", "Away W", "Away D", "Away L", "away_score", "home_score", "Away B", "Away P"]].set_axis(columns, axis=1)
+        grouped = pd.concat([home, away]).groupby("team")
+
+        teams = self.teams()
+        short_names = [team.short_name for team in teams]
+        league = grouped.sum().join(grouped.size().rename("played"))
+        league = league.reindex(short_names, fill_value=0).reset_index(drop=True)
+        league["team"] = teams
+        league["conference"] = [self.team_conferences.get(name, "A") for name in short_names]
+        league = league[["team", "conference", "played", "won", "drawn", "lost", "for", "against", "bonus", "points"]]
         league['diff'] = league['for'] - league['against']
         league = league.sort_values(["conference"])\
                        .sort_values(["points", "diff"], ascending=False)\
@@ -334,6 +337,7 @@ class Tournament():
             if {team1, team2} <= set(match.teams.values()):
                 for i, player1 in enumerate(players1):
                     for j, player2 in enumerate(players2):
-                        matrix_for[i,j] += player1.onfield_point_mutual_rate(player2, match)[0]
-                        matrix_against[i,j] += player1.onfield_point_mutual_rate(player2, match)[1]
+                        points_for, points_against = player1.onfield_point_mutual_rate(player2, match)
+                        matrix_for[i,j] += points_for
+                        matrix_against[i,j] += points_against
         return matrix_for, matrix_against, players1, players2
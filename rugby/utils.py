@@ -3,14 +3,17 @@ import json
 import pandas as pd
 from datetime import datetime, date
 
+# The scoring columns of a dense table, in the order they are checked, and
+# the points each is worth.
+SCORE_COLUMNS = (("try", 5), ("conversion", 2), ("kick", 3), ("penalty", 3))
+
 def determine_type(score):
     """
     Determine the type of score for a pandas Dataframe row.
     """
-    if score['try'] > 0: return {'type': 'try', 'value': 5, 'minute': score['try'], 'player': score.player}
-    if score['conversion'] > 0: return {'type': 'conversion', 'value': 2, 'minute': score['conversion'], 'player': score.player}
-    if score['kick'] > 0: return {'type': 'kick', 'value': 3, 'minute': score['kick'], 'player': score.player}
-    if score['penalty'] > 0: return {'type': 'penalty', 'value': 3, 'minute': score['penalty'], 'player': score.player}
+    for score_type, value in SCORE_COLUMNS:
+        if score[score_type] > 0:
+            return {'type': score_type, 'value': value, 'minute': score[score_type], 'player': score.player}
     
 def json_serial(obj):
     """JSON serializer for objects not serializable by default json code"""
@@ -25,6 +28,9 @@ def dense_table_to_nested(data):
     """
     
     match_list = []
+    score_columns = [column for column, value in SCORE_COLUMNS]
+    scoring = data[data[score_columns].sum(axis=1) > 0]
+    scoring_events = dict(list(scoring.groupby(["home", "away", "team"])))
     lineups_table = data.pivot_table(index=["round", "home", "away",  "team"], columns="position", values=["player", "on", "off", "red", "yellow"], aggfunc="first")
 
     futures = data[pd.isna(data.home_score)].groupby(["round", "date",  "home", "away"])
@@ -65,11 +71,10 @@ def dense_table_to_nested(data):
 
             scores = {}
             for team in match_dict['teams'].values():
-                events = data[(data.home==i[2]) & (data.away==i[3]) & (data.team==team)]
-                score_events = events[events[["try", "penalty", "conversion", "kick"]].sum(axis=1) > 0]
                 team_scores = []
-                for j, score in score_events.iterrows():
-                    team_scores.append(determine_type(score))
+                if (i[2], i[3], team) in scoring_events:
+                    for j, score in scoring_events[(i[2], i[3], team)].iterrows():
+                        team_scores.append(determine_type(score))
                 if team == i[2]:
                     match_dict['home']['scores'] = team_scores
                 else: